@@ -1,16 +1,14 @@
 """Exposes the high-level bindings for all Mesoscope-VR system components (cameras, microcontrollers, Zaber motors)."""
 
+from typing import TYPE_CHECKING
 from pathlib import Path  # noqa: TC003
+from contextlib import contextmanager
+from collections.abc import Callable, Iterator, Collection  # noqa: TC003
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
+from ataraxis_time import PrecisionTimer, TimerPrecisions
 from sl_shared_assets import ZaberPositions, MesoscopeCameras, MesoscopeExternalAssets, MesoscopeMicroControllers
-from ataraxis_video_system import (
-    VideoSystem,
-    VideoEncoders,
-    CameraInterfaces,
-    OutputPixelFormats,
-    EncoderSpeedPresets,
-)
 from ataraxis_base_utilities import LogLevel, console
 from ataraxis_data_structures import DataLogger  # noqa: TC002
 from ataraxis_time.time_helpers import TimeUnits, convert_time
@@ -28,6 +26,26 @@ from ..shared_components import (
     GasPuffValveInterface,
 )
 
+if TYPE_CHECKING:
+    from ataraxis_video_system import VideoSystem
+
+_ACTOR_CONTROLLER_ID: np.uint8 = np.uint8(101)
+"""The unique identifier code of the Actor AMC device, which is also used as the source ID of its log entries."""
+
+_SENSOR_CONTROLLER_ID: np.uint8 = np.uint8(152)
+"""The unique identifier code of the Sensor AMC device, which is also used as the source ID of its log entries."""
+
+_ENCODER_CONTROLLER_ID: np.uint8 = np.uint8(203)
+"""The unique identifier code of the Encoder AMC device, which is also used as the source ID of its log entries."""
+
+_FACE_CAMERA_ID: np.uint8 = np.uint8(51)
+"""The unique identifier code of the face camera's VideoSystem, which is also used as the source ID of its log 
+entries."""
+
+_BODY_CAMERA_ID: np.uint8 = np.uint8(62)
+"""The unique identifier code of the body camera's VideoSystem, which is also used as the source ID of its log 
+entries."""
+
 
 class ZaberMotors:
     """Interfaces with Zaber controllers and motors used in the Mesoscope-VR data acquisition system.
@@ -36,7 +54,8 @@ class ZaberMotors:
         This class interfaces with the three Zaber motors groups used in the system: HeadBar, Wheel, and LickPort.
 
         All communication with the managed Zaber devices is performed using asynchronous threads running in the main
-        runtime process.
+        runtime process. Since each motor group is connected to a separate serial port, the commands issued to
+        different motor groups are dispatched in parallel, using one thread per motor group.
 
         The class transitions the motors between a set of predefined states and should not be used directly by the user.
         Improperly using this class can damage the Mesoscope-VR hardware or harm the animals participating in the data
@@ -64,8 +83,16 @@ class ZaberMotors:
         _lickport_y: The ZaberAxis instance that interfaces with the lickport's Y-axis motor.
         _previous_positions: A ZaberPositions instance that stores the positions of Zaber motors used during a
            previous runtime or None if there is no previous position data to use.
+        _axes: The tuple that stores the ZaberAxis instances for all managed motors.
+        _motor_groups: The tuple that stores the ZaberAxis instances for each motor group (serial port).
+        _timer: The PrecisionTimer instance used to delay consecutive motor state polling cycles.
+        _unparked_contexts: The number of currently active unparked() contexts.
     """
 
+    _IDLE_POLLING_DELAY_MS: int = ZaberAxis._COMMUNICATION_DELAY_MS  # noqa: SLF001
+    """The delay, in milliseconds, between consecutive polling cycles used to check whether any managed motor is 
+    moving. Matches the minimum communication delay enforced by each ZaberAxis instance."""
+
     def __init__(self, zaber_positions: ZaberPositions | None, zaber_configuration: MesoscopeExternalAssets) -> None:
         # Initializes the ZaberConnection instances for all zaber controller groups.
         self._headbar: ZaberConnection = ZaberConnection(port=zaber_configuration.headbar_port)
@@ -88,6 +115,26 @@ class ZaberMotors:
         self._wheel.connect()
         self._wheel_x: ZaberAxis = self._wheel.get_device(index=0).axis
 
+        # Caches all managed motors to support polling their states without re-resolving each motor on every cycle.
+        self._axes: tuple[ZaberAxis, ...] = (
+            self._headbar_z,
+            self._headbar_pitch,
+            self._headbar_roll,
+            self._wheel_x,
+            self._lickport_z,
+            self._lickport_x,
+            self._lickport_y,
+        )
+        self._motor_groups: tuple[tuple[ZaberAxis, ...], ...] = (
+            (self._headbar_z, self._headbar_pitch, self._headbar_roll),
+            (self._wheel_x,),
+            (self._lickport_z, self._lickport_x, self._lickport_y),
+        )
+        self._timer: PrecisionTimer = PrecisionTimer(precision=TimerPrecisions.MILLISECOND)
+
+        # Tracks the number of active unparked() contexts to avoid parking the motors between chained motion commands.
+        self._unparked_contexts: int = 0
+
         # If there is no previous zaber position data to use, displays a warning message to the user.
         self._previous_positions: ZaberPositions | None = zaber_positions
         if self._previous_positions is None:
@@ -107,54 +154,36 @@ class ZaberMotors:
             to work for most animals and provide an initial position for the animal to be mounted into the Mesoscope-VR
             enclosure.
         """
-        # Disables the safety motor lock before moving the motors.
-        self.unpark_motors()
-
-        # If previous position data is available, restores all motors to the positions used during previous sessions.
-        # Otherwise, sets HeadBar and Wheel to the mounting position and the LickPort to the parking position. Note: the
-        # LickPort's parking position is closer to the animal than the mounting position, but still too far to be usable
-        # during runtime, requiring manual fine-tuning.
-        self._headbar_z.move(
-            position=self._headbar_z.mount_position
-            if self._previous_positions is None
-            else self._previous_positions.headbar_z,
-        )
-        self._headbar_pitch.move(
-            position=self._headbar_pitch.mount_position
-            if self._previous_positions is None
-            else self._previous_positions.headbar_pitch,
-        )
-        self._headbar_roll.move(
-            position=self._headbar_roll.mount_position
-            if self._previous_positions is None
-            else self._previous_positions.headbar_roll,
-        )
-        self._wheel_x.move(
-            position=self._wheel_x.mount_position
-            if self._previous_positions is None
-            else self._previous_positions.wheel_x,
-        )
-        self._lickport_z.move(
-            position=self._lickport_z.park_position
-            if self._previous_positions is None
-            else self._previous_positions.lickport_z,
-        )
-        self._lickport_x.move(
-            position=self._lickport_x.park_position
-            if self._previous_positions is None
-            else self._previous_positions.lickport_x,
-        )
-        self._lickport_y.move(
-            position=self._lickport_y.park_position
-            if self._previous_positions is None
-            else self._previous_positions.lickport_y,
-        )
-
-        # Waits for all motors to finish moving before returning to caller.
-        self.wait_until_idle()
-
-        # Prevents further interaction with the motors without manually disabling the parking lock.
-        self.park_motors()
+        # Disables the safety motor lock while moving the motors and re-enables it once the motors stop moving.
+        with self.unparked():
+            # If previous position data is available, restores all motors to the positions used during previous
+            # sessions. Otherwise, sets HeadBar and Wheel to the mounting position and the LickPort to the parking
+            # position. Note: the LickPort's parking position is closer to the animal than the mounting position, but
+            # still too far to be usable during runtime, requiring manual fine-tuning.
+            if self._previous_positions is None:
+                positions = {
+                    self._headbar_z: self._headbar_z.mount_position,
+                    self._headbar_pitch: self._headbar_pitch.mount_position,
+                    self._headbar_roll: self._headbar_roll.mount_position,
+                    self._wheel_x: self._wheel_x.mount_position,
+                    self._lickport_z: self._lickport_z.park_position,
+                    self._lickport_x: self._lickport_x.park_position,
+                    self._lickport_y: self._lickport_y.park_position,
+                }
+            else:
+                positions = {
+                    self._headbar_z: self._previous_positions.headbar_z,
+                    self._headbar_pitch: self._previous_positions.headbar_pitch,
+                    self._headbar_roll: self._previous_positions.headbar_roll,
+                    self._wheel_x: self._previous_positions.wheel_x,
+                    self._lickport_z: self._previous_positions.lickport_z,
+                    self._lickport_x: self._previous_positions.lickport_x,
+                    self._lickport_y: self._previous_positions.lickport_y,
+                }
+            self._move_motors(positions=positions)
+
+            # Waits for all motors to finish moving before returning to caller.
+            self.wait_until_idle()
 
     def prepare_motors(self) -> None:
         """Homes the managed Zaber motors in parallel.
@@ -163,23 +192,13 @@ class ZaberMotors:
             This method ensures that all motors have a stable reference point for executing all other methods exposed
             by this instance and must be called before any other method in most use contexts.
         """
-        # Disables the safety motor lock before moving the motors.
-        self.unpark_motors()
-
-        # Homes all motors in parallel.
-        self._headbar_z.home()
-        self._headbar_pitch.home()
-        self._headbar_roll.home()
-        self._wheel_x.home()
-        self._lickport_z.home()
-        self._lickport_x.home()
-        self._lickport_y.home()
+        # Disables the safety motor lock while moving the motors and re-enables it once the motors stop moving.
+        with self.unparked():
+            # Homes all motors in parallel.
+            self._execute_command(command=ZaberAxis.home, axes=self._axes)
 
-        # Waits for all motors to finish moving before returning to caller.
-        self.wait_until_idle()
-
-        # Prevents further interaction with the motors without manually disabling the parking lock.
-        self.park_motors()
+            # Waits for all motors to finish moving before returning to caller.
+            self.wait_until_idle()
 
     def park_position(self) -> None:
         """Moves the managed Zaber motors to their parking positions in parallel.
@@ -188,78 +207,58 @@ class ZaberMotors:
             This method should be called as part of the runtime's shutdown sequence to optimally position the motors to
             support homing during the next runtime.
         """
-        # Disables the safety motor lock before moving the motors.
-        self.unpark_motors()
-
-        # Moves all Zaber motors to their parking positions
-        self._headbar_z.move(position=self._headbar_z.park_position)
-        self._headbar_pitch.move(position=self._headbar_pitch.park_position)
-        self._headbar_roll.move(position=self._headbar_roll.park_position)
-        self._wheel_x.move(position=self._wheel_x.park_position)
-        self._lickport_z.move(position=self._lickport_z.park_position)
-        self._lickport_x.move(position=self._lickport_x.park_position)
-        self._lickport_y.move(position=self._lickport_y.park_position)
+        # Disables the safety motor lock while moving the motors and re-enables it once the motors stop moving.
+        with self.unparked():
+            # Moves all Zaber motors to their parking positions
+            self._move_motors(positions={axis: axis.park_position for axis in self._axes})
 
-        # Waits for all motors to finish moving before returning to caller.
-        self.wait_until_idle()
-
-        # Prevents further interaction with the motors without manually disabling the parking lock.
-        self.park_motors()
+            # Waits for all motors to finish moving before returning to caller.
+            self.wait_until_idle()
 
     def maintenance_position(self) -> None:
         """Moves the managed Zaber motors to the Mesoscope-VR system maintenance position in parallel."""
-        # Disables the safety motor lock before moving the motors.
-        self.unpark_motors()
-
-        # Moves all motors to their maintenance positions
-        self._headbar_z.move(position=self._headbar_z.maintenance_position)
-        self._headbar_pitch.move(position=self._headbar_pitch.maintenance_position)
-        self._headbar_roll.move(position=self._headbar_roll.maintenance_position)
-        self._wheel_x.move(position=self._wheel_x.maintenance_position)
-        self._lickport_z.move(position=self._lickport_z.maintenance_position)
-        self._lickport_x.move(position=self._lickport_x.maintenance_position)
-        self._lickport_y.move(position=self._lickport_y.maintenance_position)
+        # Disables the safety motor lock while moving the motors and re-enables it once the motors stop moving.
+        with self.unparked():
+            # Moves all motors to their maintenance positions
+            self._move_motors(positions={axis: axis.maintenance_position for axis in self._axes})
 
-        # Waits for all motors to finish moving before returning to caller.
-        self.wait_until_idle()
-
-        # Prevents further interaction with the motors without manually disabling the parking lock.
-        self.park_motors()
+            # Waits for all motors to finish moving before returning to caller.
+            self.wait_until_idle()
 
     def mount_position(self) -> None:
         """Moves the managed Zaber motors to the animal mounting position in parallel.
 
         This motor positioning facilitates mounting the animal into the Mesoscope-VR system enclosure.
         """
-        # Disables the safety motor lock before moving the motors.
-        self.unpark_motors()
-
-        # Moves all lickport motors to the mount position
-        self._lickport_z.move(position=self._lickport_z.mount_position)
-        self._lickport_x.move(position=self._lickport_x.mount_position)
-        self._lickport_y.move(position=self._lickport_y.mount_position)
-
-        # If previous positions are not available, moves the rest of the motors to the default mounting positions
-        if self._previous_positions is None:
-            self._headbar_z.move(position=self._headbar_z.mount_position)
-            self._headbar_pitch.move(position=self._headbar_pitch.mount_position)
-            self._headbar_roll.move(position=self._headbar_roll.mount_position)
-            self._wheel_x.move(position=self._wheel_x.mount_position)
-
-        # If previous positions are available, restores other motors to the position used during the previous runtime.
-        # This relies on the idea that mounting is primarily facilitated by moving the lickport away, while all other
-        # motors can be set to the optimal runtime parameters for the animal being mounted.
-        else:
-            self._headbar_z.move(position=self._previous_positions.headbar_z)
-            self._headbar_pitch.move(position=self._previous_positions.headbar_pitch)
-            self._headbar_roll.move(position=self._previous_positions.headbar_roll)
-            self._wheel_x.move(position=self._previous_positions.wheel_x)
-
-        # Waits for all motors to finish moving before returning to caller.
-        self.wait_until_idle()
-
-        # Prevents further interaction with the motors without manually disabling the parking lock.
-        self.park_motors()
+        # Disables the safety motor lock while moving the motors and re-enables it once the motors stop moving.
+        with self.unparked():
+            # Moves all lickport motors to the mount position
+            positions = {
+                self._lickport_z: self._lickport_z.mount_position,
+                self._lickport_x: self._lickport_x.mount_position,
+                self._lickport_y: self._lickport_y.mount_position,
+            }
+
+            # If previous positions are not available, moves the rest of the motors to the default mounting positions
+            if self._previous_positions is None:
+                positions[self._headbar_z] = self._headbar_z.mount_position
+                positions[self._headbar_pitch] = self._headbar_pitch.mount_position
+                positions[self._headbar_roll] = self._headbar_roll.mount_position
+                positions[self._wheel_x] = self._wheel_x.mount_position
+
+            # If previous positions are available, restores other motors to the position used during the previous
+            # runtime. This relies on the idea that mounting is primarily facilitated by moving the lickport away, while
+            # all other motors can be set to the optimal runtime parameters for the animal being mounted.
+            else:
+                positions[self._headbar_z] = self._previous_positions.headbar_z
+                positions[self._headbar_pitch] = self._previous_positions.headbar_pitch
+                positions[self._headbar_roll] = self._previous_positions.headbar_roll
+                positions[self._wheel_x] = self._previous_positions.wheel_x
+
+            self._move_motors(positions=positions)
+
+            # Waits for all motors to finish moving before returning to caller.
+            self.wait_until_idle()
 
     def unmount_position(self) -> None:
         """Retracts the LickPort group motors back to the mount position, while maintaining the current position for all
@@ -267,49 +266,56 @@ class ZaberMotors:
 
         This motor positioning facilitates removing the animal from the Mesoscope-VR system enclosure.
         """
-        # Disables the safety motor lock before moving the motors.
-        self.unpark_motors()
-
-        # Moves the lick-port back to the mount position, while keeping all other motors in their current positions.
-        self._lickport_y.move(position=self._lickport_y.mount_position)
-        self._lickport_z.move(position=self._lickport_z.mount_position)
-        self._lickport_x.move(position=self._lickport_x.mount_position)
-
-        # Waits for all motors to finish moving before returning to caller.
-        self.wait_until_idle()
+        # Disables the safety motor lock while moving the motors and re-enables it once the motors stop moving.
+        with self.unparked():
+            # Moves the lick-port back to the mount position, while keeping all other motors in their current positions.
+            self._move_motors(
+                positions={
+                    self._lickport_y: self._lickport_y.mount_position,
+                    self._lickport_z: self._lickport_z.mount_position,
+                    self._lickport_x: self._lickport_x.mount_position,
+                }
+            )
 
-        # Prevents further interaction with the motors without manually disabling the parking lock.
-        self.park_motors()
+            # Waits for all motors to finish moving before returning to caller.
+            self.wait_until_idle()
 
     def generate_position_snapshot(self) -> ZaberPositions:
         """Queries the current positions of all managed Zaber motors and returns the data as a ZaberPositions
         instance.
         """
+        # Queries the positions of the motors from each motor group in parallel.
+        positions: dict[ZaberAxis, int] = {}
+
+        def _query_position(axis: ZaberAxis) -> None:
+            positions[axis] = int(axis.get_position())
+
+        self._execute_command(command=_query_position, axes=self._axes)
+
         self._previous_positions = ZaberPositions(
-            headbar_z=int(self._headbar_z.get_position()),
-            headbar_pitch=int(self._headbar_pitch.get_position()),
-            headbar_roll=int(self._headbar_roll.get_position()),
-            wheel_x=int(self._wheel_x.get_position()),
-            lickport_z=int(self._lickport_z.get_position()),
-            lickport_x=int(self._lickport_x.get_position()),
-            lickport_y=int(self._lickport_y.get_position()),
+            headbar_z=positions[self._headbar_z],
+            headbar_pitch=positions[self._headbar_pitch],
+            headbar_roll=positions[self._headbar_roll],
+            wheel_x=positions[self._wheel_x],
+            lickport_z=positions[self._lickport_z],
+            lickport_x=positions[self._lickport_x],
+            lickport_y=positions[self._lickport_y],
         )
         return self._previous_positions
 
     def wait_until_idle(self) -> None:
         """Blocks in-place while at least one motor in the managed motor groups is moving."""
         # Waits for the motors to finish moving. Note, motor state polling includes the built-in delay mechanism to
-        # prevent overwhelming the communication interface.
-        while (
-            self._headbar_z.is_busy
-            or self._headbar_pitch.is_busy
-            or self._headbar_roll.is_busy
-            or self._wheel_x.is_busy
-            or self._lickport_z.is_busy
-            or self._lickport_x.is_busy
-            or self._lickport_y.is_busy
-        ):
-            pass
+        # prevent overwhelming the communication interface. Each polling cycle exits early on the first busy motor and
+        # is followed by a delay that lasts as long as the built-in delay. The delay allows the thread to sleep, so the
+        # method yields the CPU while waiting to re-query the busy motor instead of spinning inside the built-in delay
+        # loop, without delaying the detection of the motion's end. The motors, the delay method, and the delay
+        # duration are bound to local variables to avoid resolving them through the instance on every polling cycle.
+        axes = self._axes
+        delay = self._timer.delay
+        polling_delay = self._IDLE_POLLING_DELAY_MS
+        while any(axis.is_busy for axis in axes):
+            delay(delay=polling_delay, allow_sleep=True, block=False)
 
     def disconnect(self) -> None:
         """Shuts down all managed motors and disconnects from the motor groups."""
@@ -321,33 +327,80 @@ class ZaberMotors:
         """Parks all managed Zaber motors, preventing them from being moved via this library or Zaber GUI until
         they are unparked.
         """
-        self._headbar_pitch.park()
-        self._headbar_roll.park()
-        self._headbar_z.park()
-        self._wheel_x.park()
-        self._lickport_x.park()
-        self._lickport_y.park()
-        self._lickport_z.park()
+        self._execute_command(command=ZaberAxis.park, axes=self._axes)
 
     def unpark_motors(self) -> None:
         """Unparks all managed motor groups, allowing them to be moved via this library or the Zaber GUI."""
-        self._headbar_pitch.unpark()
-        self._headbar_roll.unpark()
-        self._headbar_z.unpark()
-        self._wheel_x.unpark()
-        self._lickport_x.unpark()
-        self._lickport_y.unpark()
-        self._lickport_z.unpark()
+        self._execute_command(command=ZaberAxis.unpark, axes=self._axes)
+
+    @contextmanager
+    def unparked(self) -> Iterator[None]:
+        """Unparks all managed motors when entering the context and parks them when exiting the context.
+
+        Notes:
+            All motion methods of this class use this context. Nesting the contexts only unparks and parks the motors
+            once, at the boundaries of the outermost context. Use this context to chain multiple motion methods
+            without parking the motors between the method calls.
+
+            If the context exits due to an error, the motors are not parked.
+        """
+        if self._unparked_contexts == 0:
+            self.unpark_motors()
+
+        self._unparked_contexts += 1
+        try:
+            yield
+        finally:
+            self._unparked_contexts -= 1
+
+        # Only parks the motors when exiting the outermost context.
+        if self._unparked_contexts == 0:
+            self.park_motors()
+
+    def _move_motors(self, positions: dict[ZaberAxis, int]) -> None:
+        """Initiates moving the target motors to the requested positions without waiting for the motion to complete.
+
+        Args:
+            positions: A dictionary that maps the ZaberAxis instance of each motor to move to the absolute position, in
+                native motor units, to move the motor to.
+        """
+        self._execute_command(command=lambda axis: axis.move(position=positions[axis]), axes=positions.keys())
+
+    def _execute_command(self, command: Callable[[ZaberAxis], None], axes: Collection[ZaberAxis]) -> None:
+        """Executes the command for each target motor, processing the motors from each motor group in parallel.
+
+        Notes:
+            Each motor group uses a separate serial port, so the commands sent to different motor groups do not compete
+            for the same communication interface. Within each motor group, the commands are executed sequentially in
+            the order the motors appear in the 'axes' collection.
+
+        Args:
+            command: The callable that issues the command to a single motor. The callable has to take the ZaberAxis
+                instance of the motor as its only argument.
+            axes: The ZaberAxis instances of the motors to which to issue the command.
+        """
+        # Splits the target motors into motor groups, preserving the requested command execution order.
+        groups = [[axis for axis in axes if axis in group] for group in self._motor_groups]
+        groups = [group for group in groups if group]
+
+        # Processes each motor group using a separate thread.
+        with ThreadPoolExecutor(max_workers=len(self._motor_groups)) as executor:
+            futures = {executor.submit(self._execute_group_command, command=command, axes=group) for group in groups}
+            for future in as_completed(futures):
+                # Propagates any exceptions encountered while executing the command.
+                future.result()
+
+    @staticmethod
+    def _execute_group_command(command: Callable[[ZaberAxis], None], axes: list[ZaberAxis]) -> None:
+        """Sequentially executes the command for each of the input motors."""
+        for axis in axes:
+            command(axis)
 
     @property
     def is_connected(self) -> bool:
         """Returns True if all managed motor connections are active and False if at least one connection is inactive."""
-        connections = [
-            self._headbar.is_connected,
-            self._lickport.is_connected,
-            self._wheel.is_connected,
-        ]
-        return all(connections)
+        # Each connection check probes the underlying serial port, so the chain stops at the first inactive connection.
+        return self._headbar.is_connected and self._lickport.is_connected and self._wheel.is_connected
 
 
 class MicroControllerInterfaces:
@@ -370,6 +423,7 @@ class MicroControllerInterfaces:
     Attributes:
         _started: Tracks whether the microcontroller communication processes are currently running.
         _configuration: Stores the managed microcontrollers' configuration parameters.
+        _screen_pulse_duration: The duration, in microseconds, of the pulse used to toggle the VR screens' power state.
         brake: The interface that controls the electromagnetic particle brake attached to the running wheel.
         valve: The interface that controls the solenoid water valve.
         gas_puff_valve: The interface that controls the gas puff valve.
@@ -385,7 +439,8 @@ class MicroControllerInterfaces:
     """
 
     def __init__(self, data_logger: DataLogger, microcontroller_configuration: MesoscopeMicroControllers) -> None:
-        # Tracks whether the communication processes have been started.
+        # Tracks whether the communication processes have been started. This has to be the first assigned attribute, as
+        # the __del__() method relies on it to safely handle instances whose initialization raised an error.
         self._started: bool = False
 
         # Caches the microcontroller configuration parameters to the instance attribute.
@@ -401,6 +456,16 @@ class MicroControllerInterfaces:
             )
         )
 
+        # Converts the screen trigger pulse duration from milliseconds to microseconds. Since the configuration does not
+        # change during runtime, the conversion is carried out once, and the result is reused by the start() method.
+        self._screen_pulse_duration: int = round(
+            convert_time(
+                time=self._configuration.screen_trigger_pulse_duration_ms,
+                from_units=TimeUnits.MILLISECOND,
+                to_units=TimeUnits.MICROSECOND,
+            )
+        )
+
         # ACTOR. Actor AMC controls the hardware that needs to be triggered by PC at irregular intervals. Most of such
         # hardware is designed to produce some form of an output: deliver water reward, engage wheel brake, etc.
 
@@ -417,7 +482,7 @@ class MicroControllerInterfaces:
 
         # Main interface:
         self._actor: MicroControllerInterface = MicroControllerInterface(
-            controller_id=np.uint8(101),
+            controller_id=_ACTOR_CONTROLLER_ID,
             buffer_size=8192,
             port=self._configuration.actor_port,
             data_logger=data_logger,
@@ -444,7 +509,7 @@ class MicroControllerInterfaces:
 
         # Main interface:
         self._sensor: MicroControllerInterface = MicroControllerInterface(
-            controller_id=np.uint8(152),
+            controller_id=_SENSOR_CONTROLLER_ID,
             buffer_size=8192,
             port=self._configuration.sensor_port,
             data_logger=data_logger,
@@ -466,7 +531,7 @@ class MicroControllerInterfaces:
 
         # Main interface:
         self._encoder: MicroControllerInterface = MicroControllerInterface(
-            controller_id=np.uint8(203),
+            controller_id=_ENCODER_CONTROLLER_ID,
             buffer_size=8192,
             port=self._configuration.encoder_port,
             data_logger=data_logger,
@@ -489,10 +554,14 @@ class MicroControllerInterfaces:
         message = "Initializing Ataraxis Micro Controller (AMC) Interfaces..."
         console.echo(message=message, level=LogLevel.INFO)
 
-        # Starts all microcontroller interfaces
-        self._actor.start()
-        self._sensor.start()
-        self._encoder.start()
+        # Marks the instance as started before starting the communication processes. If starting any process or
+        # configuring any hardware module fails, this ensures that the stop() method, which is also called by
+        # __del__(), terminates all processes that have already been started.
+        self._started = True
+
+        # Starts all microcontroller interfaces. Since each microcontroller uses a separate serial port, the
+        # communication processes are started in parallel to overlap their startup handshakes.
+        self._execute_command(command=MicroControllerInterface.start)
 
         self.wheel_encoder.initialize_local_assets()
         self.valve.initialize_local_assets()
@@ -507,12 +576,7 @@ class MicroControllerInterfaces:
         )
 
         # Screen Interface
-        screen_pulse_duration: np.float64 = convert_time(  # type: ignore[assignment]
-            time=self._configuration.screen_trigger_pulse_duration_ms,
-            from_units="ms",
-            to_units="us",
-        )
-        self.screens.set_parameters(pulse_duration=np.uint32(round(screen_pulse_duration)))
+        self.screens.set_parameters(pulse_duration=np.uint32(self._screen_pulse_duration))
 
         # Lick Sensor
         self.lick.set_parameters(
@@ -535,9 +599,6 @@ class MicroControllerInterfaces:
             averaging_pool_size=np.uint8(self._configuration.mesoscope_frame_averaging_pool_size)
         )
 
-        # The setup procedure is complete.
-        self._started = True
-
         message = "Ataraxis Micro Controller (AMC) Interfaces: Initialized."
         console.echo(message=message, level=LogLevel.SUCCESS)
 
@@ -553,14 +614,27 @@ class MicroControllerInterfaces:
         # Resets the _started tracker
         self._started = False
 
-        # Stops all microcontroller interfaces. This also shuts down and resets all managed hardware modules.
-        self._actor.stop()
-        self._sensor.stop()
-        self._encoder.stop()
+        # Stops all microcontroller interfaces in parallel. This also shuts down and resets all managed hardware
+        # modules.
+        self._execute_command(command=MicroControllerInterface.stop)
 
         message = "Ataraxis Micro Controller (AMC) Interfaces: Terminated."
         console.echo(message=message, level=LogLevel.SUCCESS)
 
+    def _execute_command(self, command: Callable[[MicroControllerInterface], None]) -> None:
+        """Executes the command for all managed microcontrollers in parallel.
+
+        Args:
+            command: The callable that issues the command to a single microcontroller. The callable has to take the
+                MicroControllerInterface instance of the microcontroller as its only argument.
+        """
+        controllers = (self._actor, self._sensor, self._encoder)
+        with ThreadPoolExecutor(max_workers=len(controllers)) as executor:
+            futures = {executor.submit(command, controller) for controller in controllers}
+            for future in as_completed(futures):
+                # Propagates any exceptions encountered while executing the method.
+                future.result()
+
 
 class VideoSystems:
     """Interfaces with the Ataraxis Video System (AVS) devices used in the Mesoscope-VR data acquisition system.
@@ -572,6 +646,9 @@ class VideoSystems:
         Calling the class initializer does not start the camera producer and consumer processes. Call other instance
         methods to enable acquiring (grabbing) and saving (caching) the desired camera's frames.
 
+        The VideoSystem instance for each managed camera is only initialized the first time the camera is started. This
+        allows runtimes that only use a subset of the managed cameras to avoid connecting to the unused cameras.
+
         Once camera frame acquisition is enabled, the only way to disable frame acquisition is to call the main stop()
         method that stops all active cameras. Similarly, once frame saving is started, there is no way to disable it
         without stopping the entire instance.
@@ -588,10 +665,13 @@ class VideoSystems:
     Attributes:
         _face_camera_started: Tracks whether the face camera frame acquisition is running.
         _body_camera_started: Tracks whether the body cameras frame acquisition is running.
+        _data_logger: Stores the DataLogger instance used to log the data generated by the managed cameras.
+        _camera_configuration: Stores the managed cameras' configuration parameters.
+        _output_directory: Stores the path to the directory where to output the generated .MP4 video files.
         _face_camera: The interface that captures and saves the frames acquired by the camera aimed at the animal's face
-            and eye.
+            and eye or None if the face camera has not been initialized.
         _body_camera: The interface that captures and saves the frames acquired by the camera aimed at the animal's
-            body.
+            body or None if the body camera has not been initialized.
     """
 
     # noinspection PyTypeChecker
@@ -605,40 +685,82 @@ class VideoSystems:
         self._face_camera_started: bool = False
         self._body_camera_started: bool = False
 
-        # Initializes the face camera system.
-        self._face_camera: VideoSystem = VideoSystem(
-            system_id=np.uint8(51),
-            data_logger=data_logger,
-            output_directory=output_directory,
-            camera_index=camera_configuration.face_camera_index,
-            camera_interface=CameraInterfaces.HARVESTERS,
-            display_frame_rate=25,
-            video_encoder=VideoEncoders.H265,
-            gpu=0,
-            encoder_speed_preset=EncoderSpeedPresets(camera_configuration.face_camera_preset),
-            output_pixel_format=OutputPixelFormats.YUV420,  # Monochrome videos do not require chrominance sampling.
-            quantization_parameter=camera_configuration.face_camera_quantization,
+        # Caches the parameters used to initialize the managed cameras' VideoSystem instances.
+        self._data_logger: DataLogger = data_logger
+        self._camera_configuration: MesoscopeCameras = camera_configuration
+        self._output_directory: Path = output_directory
+
+        # Defers initializing the camera systems until each camera is started for the first time.
+        self._face_camera: VideoSystem | None = None
+        self._body_camera: VideoSystem | None = None
+
+    def __del__(self) -> None:
+        """Ensures that all consumer and producer processes are terminated when the instance is garbage-collected."""
+        self.stop()
+
+    def _get_face_camera(self) -> VideoSystem:
+        """Returns the VideoSystem instance that manages the face camera, initializing it on first access."""
+        if self._face_camera is None:
+            self._face_camera = self._create_camera(
+                system_id=_FACE_CAMERA_ID,
+                camera_index=self._camera_configuration.face_camera_index,
+                encoder_preset=self._camera_configuration.face_camera_preset,
+                quantization_parameter=self._camera_configuration.face_camera_quantization,
+            )
+        return self._face_camera
+
+    def _get_body_camera(self) -> VideoSystem:
+        """Returns the VideoSystem instance that manages the body camera, initializing it on first access."""
+        if self._body_camera is None:
+            self._body_camera = self._create_camera(
+                system_id=_BODY_CAMERA_ID,
+                camera_index=self._camera_configuration.body_camera_index,
+                encoder_preset=self._camera_configuration.body_camera_preset,
+                quantization_parameter=self._camera_configuration.body_camera_quantization,
+            )
+        return self._body_camera
+
+    def _create_camera(
+        self, system_id: np.uint8, camera_index: int, encoder_preset: int, quantization_parameter: int
+    ) -> VideoSystem:
+        """Initializes the VideoSystem instance that manages the specified Harvesters (GeniCam) camera.
+
+        Notes:
+            The ataraxis-video-system library is imported when the first camera is initialized. This avoids loading
+            the library and its encoding dependencies for runtimes and CLI commands that do not use cameras.
+
+        Args:
+            system_id: The unique identifier code of the camera's VideoSystem.
+            camera_index: The index of the camera in the list of all cameras discoverable through the Harvesters
+                interface.
+            encoder_preset: The value of the EncoderSpeedPresets member to use for encoding the camera's frames.
+            quantization_parameter: The quantization parameter to use for encoding the camera's frames.
+
+        Returns:
+            The initialized VideoSystem instance.
+        """
+        from ataraxis_video_system import (  # noqa: PLC0415
+            VideoSystem,
+            VideoEncoders,
+            CameraInterfaces,
+            OutputPixelFormats,
+            EncoderSpeedPresets,
         )
 
-        # Initializes the body camera system.
-        self._body_camera: VideoSystem = VideoSystem(
-            system_id=np.uint8(62),
-            data_logger=data_logger,
-            output_directory=output_directory,
-            camera_index=camera_configuration.body_camera_index,
+        return VideoSystem(
+            system_id=system_id,
+            data_logger=self._data_logger,
+            output_directory=self._output_directory,
+            camera_index=camera_index,
             camera_interface=CameraInterfaces.HARVESTERS,
             display_frame_rate=25,
             video_encoder=VideoEncoders.H265,
             gpu=0,
-            encoder_speed_preset=EncoderSpeedPresets(camera_configuration.body_camera_preset),
+            encoder_speed_preset=EncoderSpeedPresets(encoder_preset),
             output_pixel_format=OutputPixelFormats.YUV420,  # Monochrome videos do not require chrominance sampling.
-            quantization_parameter=camera_configuration.body_camera_quantization,
+            quantization_parameter=quantization_parameter,
         )
 
-    def __del__(self) -> None:
-        """Ensures that all consumer and producer processes are terminated when the instance is garbage-collected."""
-        self.stop()
-
     def start_face_camera(self) -> None:
         """Starts acquiring frames from the face camera.
 
@@ -654,7 +776,7 @@ class VideoSystems:
         console.echo(message=message, level=LogLevel.INFO)
 
         # Starts frame acquisition. Note: this does NOT start frame saving.
-        self._face_camera.start()
+        self._get_face_camera().start()
         self._face_camera_started = True
 
         message = "Face camera frame acquisition: Started."
@@ -675,21 +797,117 @@ class VideoSystems:
         console.echo(message=message, level=LogLevel.INFO)
 
         # Starts frame acquisition. Note: this does NOT start frame saving.
-        self._body_camera.start()
+        self._get_body_camera().start()
         self._body_camera_started = True
 
         message = "Body camera frame acquisition: Started."
         console.echo(message=message, level=LogLevel.SUCCESS)
 
+    def start_all(self) -> None:
+        """Starts acquiring frames from all managed cameras in parallel.
+
+        Notes:
+            Does not start saving the acquired frames to disk. Call the save_face_camera_frames() and
+            save_body_camera_frames() methods to start saving the acquired frames to disk.
+
+            Starting each camera requires spawning its producer and consumer processes and connecting to the camera
+            via the GenTL producer, which takes a significant amount of time. This method overlaps these delays by
+            starting all cameras concurrently, so the total startup time is bound by the slowest camera.
+
+            If any camera fails to start, the method waits for all other cameras to finish their startup sequence and
+            marks each camera that started successfully as running before re-raising the error. This ensures that the
+            stop() method releases the processes of all running cameras.
+        """
+        # Determines which cameras need to be started. Each camera is paired with its display name and the name of the
+        # attribute that tracks whether the camera is running. Cameras that are already running are excluded from
+        # processing.
+        cameras: list[tuple[str, VideoSystem, str]] = [
+            (name, get_camera(), started_flag)
+            for name, get_camera, started_flag in (
+                ("Face", self._get_face_camera, "_face_camera_started"),
+                ("Body", self._get_body_camera, "_body_camera_started"),
+            )
+            if not getattr(self, started_flag)
+        ]
+
+        # Prevents executing this method if all cameras are already running.
+        if not cameras:
+            return
+
+        message = "Initializing camera frame acquisition..."
+        console.echo(message=message, level=LogLevel.INFO)
+
+        # Starts frame acquisition for all cameras in parallel. Note: this does NOT start frame saving.
+        startup_error: BaseException | None = None
+        with ThreadPoolExecutor(max_workers=len(cameras)) as executor:
+            futures = {
+                executor.submit(self._start_camera, camera=camera): (name, started_flag)
+                for name, camera, started_flag in cameras
+            }
+            for future in as_completed(futures):
+                # Defers propagating startup errors until all cameras finish their startup sequence, so that all
+                # cameras that started successfully are marked as running.
+                error = future.exception()
+                if error is not None:
+                    startup_error = startup_error or error
+                    continue
+
+                # Marks each camera as started as soon as its startup sequence completes.
+                name, started_flag = futures[future]
+                setattr(self, started_flag, True)
+
+                message = f"{name} camera frame acquisition startup time: {future.result()} ms."
+                console.echo(message=message, level=LogLevel.DEBUG)
+
+        # Propagates the first exception encountered while starting the cameras.
+        if startup_error is not None:
+            raise startup_error
+
+        message = "Camera frame acquisition: Started."
+        console.echo(message=message, level=LogLevel.SUCCESS)
+
+    @staticmethod
+    def _start_camera(camera: VideoSystem) -> int:
+        """Starts acquiring frames from the input camera and returns the time, in milliseconds, it took to start the
+        camera.
+        """
+        timer = PrecisionTimer(precision=TimerPrecisions.MILLISECOND)
+        camera.start()
+        return timer.elapsed
+
     def save_face_camera_frames(self) -> None:
-        """Starts saving the frames acquired by the face camera to disk as an .MP4 video file."""
-        self._face_camera.start_frame_saving()
+        """Starts saving the frames acquired by the face camera to disk as an .MP4 video file.
+
+        Raises:
+            RuntimeError: If the face camera frame acquisition is not running.
+        """
+        # Prevents creating and connecting to the camera only to start saving frames that are not being acquired.
+        if not self._face_camera_started:
+            message = (
+                "Unable to start saving the frames acquired by the face camera, as the face camera frame acquisition "
+                "is not running. Call the start_face_camera() or start_all() method before saving the frames."
+            )
+            console.error(message=message, error=RuntimeError)
+
+        self._get_face_camera().start_frame_saving()
         message = "Face camera frame saving: Started."
         console.echo(message=message, level=LogLevel.SUCCESS)
 
     def save_body_camera_frames(self) -> None:
-        """Starts saving the frames acquired by the body camera to disk as an .MP4 video file."""
-        self._body_camera.start_frame_saving()
+        """Starts saving the frames acquired by the body camera to disk as an .MP4 video file.
+
+        Raises:
+            RuntimeError: If the body camera frame acquisition is not running.
+        """
+        # Prevents creating and connecting to the camera only to start saving frames that are not being acquired.
+        if not self._body_camera_started:
+            message = (
+                "Unable to start saving the frames acquired by the body camera, as the body camera frame acquisition "
+                "is not running. Call the start_body_camera() or start_all() method before saving the frames."
+            )
+            console.error(message=message, error=RuntimeError)
+
+        self._get_body_camera().start_frame_saving()
         message = "Body camera frame saving: Started."
         console.echo(message=message, level=LogLevel.SUCCESS)
 
@@ -702,22 +920,27 @@ class VideoSystems:
         message = "Stopping camera frame acquisition and saving..."
         console.echo(message=message, level=LogLevel.INFO)
 
-        # Instructs all active cameras to stop saving frames
-        if self._face_camera_started:
-            self._face_camera.stop_frame_saving()
-        if self._body_camera_started:
-            self._body_camera.stop_frame_saving()
-
-        message = "Camera frame saving: Stopped."
-        console.echo(message=message, level=LogLevel.SUCCESS)
+        # Instructs all active cameras to stop saving frames. This only flips a shared memory flag for each camera, so
+        # the cameras are processed sequentially.
+        for camera, started in (
+            (self._face_camera, self._face_camera_started),
+            (self._body_camera, self._body_camera_started),
+        ):
+            if started and camera is not None:
+                camera.stop_frame_saving()
 
-        # Stops all cameras
-        self._face_camera.stop()
-        self._body_camera.stop()
+        # Stops all initialized cameras in parallel. Each camera waits for its producer and consumer processes to
+        # shut down independently, so the cameras are stopped concurrently to overlap their shutdown latencies.
+        initialized_cameras = [camera for camera in (self._face_camera, self._body_camera) if camera is not None]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {executor.submit(camera.stop) for camera in initialized_cameras}
+            for future in as_completed(futures):
+                future.result()
 
         # Marks all cameras as stopped
         self._face_camera_started = False
         self._body_camera_started = False
 
-        message = "Camera frame acquisition: Stopped."
+        # Reports the completion of the shutdown sequence once both frame saving and frame acquisition are stopped.
+        message = "Camera frame acquisition and saving: Stopped."
         console.echo(message=message, level=LogLevel.SUCCESS)
@@ -1,6 +1,10 @@
 from pathlib import Path
+from contextlib import contextmanager
+from collections.abc import Callable, Iterator, Collection
 
+import numpy as np
 from _typeshed import Incomplete
+from ataraxis_time import PrecisionTimer
 from sl_shared_assets import (
     ZaberPositions,
     MesoscopeCameras as MesoscopeCameras,
@@ -26,6 +30,12 @@ from ..shared_components import (
     GasPuffValveInterface as GasPuffValveInterface,
 )
 
+_ACTOR_CONTROLLER_ID: np.uint8
+_SENSOR_CONTROLLER_ID: np.uint8
+_ENCODER_CONTROLLER_ID: np.uint8
+_FACE_CAMERA_ID: np.uint8
+_BODY_CAMERA_ID: np.uint8
+
 class ZaberMotors:
     _headbar: ZaberConnection
     _wheel: ZaberConnection
@@ -37,7 +47,12 @@ class ZaberMotors:
     _lickport_y: ZaberAxis
     _lickport_x: ZaberAxis
     _wheel_x: ZaberAxis
+    _IDLE_POLLING_DELAY_MS: int
     _previous_positions: ZaberPositions | None
+    _axes: tuple[ZaberAxis, ...]
+    _motor_groups: tuple[tuple[ZaberAxis, ...], ...]
+    _timer: PrecisionTimer
+    _unparked_contexts: int
     def __init__(
         self, zaber_positions: ZaberPositions | None, zaber_configuration: MesoscopeExternalAssets
     ) -> None: ...
@@ -52,12 +67,19 @@ class ZaberMotors:
     def disconnect(self) -> None: ...
     def park_motors(self) -> None: ...
     def unpark_motors(self) -> None: ...
+    @contextmanager
+    def unparked(self) -> Iterator[None]: ...
+    def _move_motors(self, positions: dict[ZaberAxis, int]) -> None: ...
+    def _execute_command(self, command: Callable[[ZaberAxis], None], axes: Collection[ZaberAxis]) -> None: ...
+    @staticmethod
+    def _execute_group_command(command: Callable[[ZaberAxis], None], axes: list[ZaberAxis]) -> None: ...
     @property
     def is_connected(self) -> bool: ...
 
 class MicroControllerInterfaces:
     _started: bool
     _configuration: MesoscopeMicroControllers
+    _screen_pulse_duration: int
     brake: Incomplete
     valve: Incomplete
     gas_puff_valve: Incomplete
@@ -73,18 +95,30 @@ class MicroControllerInterfaces:
     def __del__(self) -> None: ...
     def start(self) -> None: ...
     def stop(self) -> None: ...
+    def _execute_command(self, command: Callable[[MicroControllerInterface], None]) -> None: ...
 
 class VideoSystems:
     _face_camera_started: bool
     _body_camera_started: bool
-    _face_camera: VideoSystem
-    _body_camera: VideoSystem
+    _data_logger: DataLogger
+    _camera_configuration: MesoscopeCameras
+    _output_directory: Path
+    _face_camera: VideoSystem | None
+    _body_camera: VideoSystem | None
     def __init__(
         self, data_logger: DataLogger, camera_configuration: MesoscopeCameras, output_directory: Path
     ) -> None: ...
     def __del__(self) -> None: ...
+    def _get_face_camera(self) -> VideoSystem: ...
+    def _get_body_camera(self) -> VideoSystem: ...
+    def _create_camera(
+        self, system_id: np.uint8, camera_index: int, encoder_preset: int, quantization_parameter: int
+    ) -> VideoSystem: ...
     def start_face_camera(self) -> None: ...
     def start_body_camera(self) -> None: ...
+    def start_all(self) -> None: ...
+    @staticmethod
+    def _start_camera(camera: VideoSystem) -> int: ...
     def save_face_camera_frames(self) -> None: ...
     def save_body_camera_frames(self) -> None: ...
     def stop(self) -> None: ...
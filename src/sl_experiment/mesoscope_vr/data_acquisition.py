@@ -6,7 +6,6 @@ import os
 import copy
 from enum import IntEnum, StrEnum
 import json
-from json import dumps
 import shutil as sh
 from pathlib import Path
 import tempfile
@@ -38,9 +37,6 @@ from ataraxis_data_structures import DataLogger, LogPackage
 from ataraxis_communication_interface import MQTTCommunication, MicroControllerInterface
 
 from .tools import MesoscopeData, CachedMotifDecomposer, get_system_configuration
-from .runtime_ui import RuntimeControlUI
-from .visualizers import VisualizerMode, BehaviorVisualizer
-from .maintenance_ui import MaintenanceControlUI
 from .binding_classes import ZaberMotors, VideoSystems, MicroControllerInterfaces
 from ..shared_components import (
     BrakeInterface,
@@ -63,6 +59,65 @@ _RENDERING_SEPARATION_DELAY = 500
 _response_delay_timer = PrecisionTimer(precision=TimerPrecisions.MILLISECOND)
 """The PrecisionTimer instance used to support the proper rendering of all terminal outputs used during runtime."""
 
+_MOVEMENT_PAYLOAD_TEMPLATE: bytes = b'{"movement": %r}'
+"""The template for the JSON-encoded payload of the Unity encoder data messages. Formatting the template with a Python 
+float produces the same payload as serializing the {"movement": value} dictionary via json.dumps(), but avoids creating 
+and serializing the dictionary for each message sent during runtime."""
+
+
+def _get_mesoscope_coordinates(positions: MesoscopePositions) -> tuple[float, ...]:
+    """Extracts the user-updated mesoscope imaging coordinates from the input MesoscopePositions instance.
+
+    Args:
+        positions: The MesoscopePositions instance from which to extract the coordinates.
+
+    Returns:
+        A tuple that stores the mesoscope's x, y, z, roll, fast_z, tip, and tilt coordinates, the laser power, and the
+        red dot alignment z-coordinate, in this order.
+    """
+    return (
+        positions.mesoscope_x,
+        positions.mesoscope_y,
+        positions.mesoscope_z,
+        positions.mesoscope_roll,
+        positions.mesoscope_fast_z,
+        positions.mesoscope_tip,
+        positions.mesoscope_tilt,
+        positions.laser_power_mw,
+        positions.red_dot_alignment_z,
+    )
+
+
+def _prompt_user(message: str, level: LogLevel = LogLevel.INFO) -> None:
+    """Displays the message to the user and blocks until the user acknowledges it.
+
+    Notes:
+        The acknowledgement prompt is displayed after a delay to ensure the user reads the message before continuing.
+
+    Args:
+        message: The message to display to the user.
+        level: The logging level to use for displaying the message.
+    """
+    console.echo(message=message, level=level)
+    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
+    input("Enter anything to continue: ")
+
+
+def _prompt_yes_no() -> bool:
+    """Blocks until the user provides a valid 'yes' or 'no' answer via the terminal.
+
+    Notes:
+        Only the first character of the user's answer is evaluated, so the method accepts both the full and the
+        abbreviated forms of each answer.
+
+    Returns:
+        True if the user answered 'yes' and False if the user answered 'no'.
+    """
+    while True:
+        answer = input("Enter 'yes' or 'no': ").strip()[:1].lower()
+        if answer in {"y", "n"}:
+            return answer == "y"
+
 
 # Defines shared methods to make their use consistent between window checking and other runtimes.
 def _generate_mesoscope_position_snapshot(session_data: SessionData, mesoscope_data: MesoscopeData) -> None:
@@ -77,31 +132,34 @@ def _generate_mesoscope_position_snapshot(session_data: SessionData, mesoscope_d
     if session_data.raw_data.nk_path.exists():
         return
 
-    # Loads the previous position data into memory.
-    previous_mesoscope_positions: MesoscopePositions = MesoscopePositions.from_yaml(
-        file_path=mesoscope_data.vrpc_data.mesoscope_positions_path
+    # Resolves the paths and the session name used throughout the snapshot generation sequence once.
+    session_name = session_data.session_name
+    session_positions_path = session_data.raw_data.mesoscope_positions_path
+    persistent_positions_path = mesoscope_data.vrpc_data.mesoscope_positions_path
+
+    # Loads the previous position data into memory. Only the coordinates are used below, so they are extracted once
+    # and reused to validate each attempt to update the session's position file.
+    previous_coordinates = _get_mesoscope_coordinates(
+        positions=MesoscopePositions.from_yaml(file_path=persistent_positions_path)
     )
 
     # Forces the user to update the cached mesoscope position coordinates with the current data.
     message = (
-        f"Update the data inside the mesoscope_positions.yaml file stored under the {session_data.session_name} "
+        f"Update the data inside the mesoscope_positions.yaml file stored under the {session_name} "
         f"session's 'raw_data' directory to reflect the current mesoscope objective position."
     )
-    console.echo(message=message, level=LogLevel.INFO)
-    # Delays for 2 seconds to ensure the user reads the message before continuing.
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message)
 
     # Defines the error message for file formatting issues
     io_error_message = (
-        f"Unable to read the data from the {session_data.session_name} session's mesoscope_positions.yaml file. This "
+        f"Unable to read the data from the {session_name} session's mesoscope_positions.yaml file. This "
         f"indicates that the file was mis-formatted during editing. Make sure the file contents follow the .YAML "
         f"format before retrying."
     )
 
     # Defines the validation error message for unchanged positions
     validation_error_message = (
-        f"Failed to verify that the mesoscope_positions.yaml file stored inside the {session_data.session_name} "
+        f"Failed to verify that the mesoscope_positions.yaml file stored inside the {session_name} "
         f"session's raw_data directory has been updated to include the mesoscope imaging coordinates used during "
         f"runtime. Edit the mesoscope_positions.yaml file to update the position fields with coordinates "
         f"displayed in the ScanImage software or on the ThorLabs pad. Make sure to save the changes by pressing "
@@ -113,26 +171,14 @@ def _generate_mesoscope_position_snapshot(session_data: SessionData, mesoscope_d
         # Attempts to read the current mesoscope positions from the session file
         # noinspection PyBroadException
         try:
-            mesoscope_positions: MesoscopePositions = MesoscopePositions.from_yaml(
-                file_path=session_data.raw_data.mesoscope_positions_path,
-            )
+            mesoscope_positions: MesoscopePositions = MesoscopePositions.from_yaml(file_path=session_positions_path)
         except Exception:
             console.echo(message=io_error_message, level=LogLevel.ERROR)
             input("Enter anything to continue: ")
             continue
 
-        # Validates that the user has updated the position data
-        if (
-            mesoscope_positions.mesoscope_x != previous_mesoscope_positions.mesoscope_x
-            or mesoscope_positions.mesoscope_y != previous_mesoscope_positions.mesoscope_y
-            or mesoscope_positions.mesoscope_z != previous_mesoscope_positions.mesoscope_z
-            or mesoscope_positions.mesoscope_roll != previous_mesoscope_positions.mesoscope_roll
-            or mesoscope_positions.mesoscope_fast_z != previous_mesoscope_positions.mesoscope_fast_z
-            or mesoscope_positions.mesoscope_tip != previous_mesoscope_positions.mesoscope_tip
-            or mesoscope_positions.mesoscope_tilt != previous_mesoscope_positions.mesoscope_tilt
-            or mesoscope_positions.laser_power_mw != previous_mesoscope_positions.laser_power_mw
-            or mesoscope_positions.red_dot_alignment_z != previous_mesoscope_positions.red_dot_alignment_z
-        ):
+        # Validates that the user has updated at least one of the position coordinates.
+        if _get_mesoscope_coordinates(positions=mesoscope_positions) != previous_coordinates:
             break
 
         # If positions match, request the user to update the file
@@ -140,10 +186,7 @@ def _generate_mesoscope_position_snapshot(session_data: SessionData, mesoscope_d
         input("Enter anything to continue: ")
 
     # Copies the updated mesoscope positions data into the animal's persistent directory.
-    sh.copy2(
-        src=session_data.raw_data.mesoscope_positions_path,
-        dst=mesoscope_data.vrpc_data.mesoscope_positions_path,
-    )
+    sh.copy2(src=session_positions_path, dst=persistent_positions_path)
 
 
 def _generate_zaber_snapshot(
@@ -188,18 +231,10 @@ def _setup_zaber_motors(zaber_motors: ZaberMotors) -> None:
     console.echo(message=message, level=LogLevel.INFO)
     _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
 
-    # Blocks until a valid answer is received from the user.
-    while True:
-        user_input = input("Enter 'yes' or 'no': ").strip().lower()
-        answer = user_input[0] if user_input else ""
-
-        if answer == "n":
-            # Aborts method runtime, as no further Zaber setup is required.
-            return
-
-        if answer == "y":
-            # Proceeds with the setup sequence.
-            break
+    # Blocks until a valid answer is received from the user. If the user declines, aborts method runtime, as no further
+    # Zaber setup is required.
+    if not _prompt_yes_no():
+        return
 
     # Since it is now possible to shut down Zaber motors without fixing HeadBarRoll position, requests the user
     # to verify this manually.
@@ -207,9 +242,7 @@ def _setup_zaber_motors(zaber_motors: ZaberMotors) -> None:
         "Check that the HeadBarRoll motor has a positive (>0) angle. If the angle is negative (<0), the motor will "
         "collide with the stopper during homing, which will DAMAGE the motor."
     )
-    console.echo(message=message, level=LogLevel.WARNING)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message, level=LogLevel.WARNING)
 
     # Initializes the Zaber positioning sequence. This relies heavily on user feedback to confirm that it is
     # safe to proceed with motor movements.
@@ -217,15 +250,13 @@ def _setup_zaber_motors(zaber_motors: ZaberMotors) -> None:
         "Preparing to move Zaber motors into mounting position. Remove the mesoscope objective, swivel out the "
         "VR screens, and make sure the animal is NOT mounted in the Mesoscope's enclosure."
     )
-    console.echo(message=message, level=LogLevel.WARNING)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
-
-    # Homes all managed motors in parallel.
-    zaber_motors.prepare_motors()
+    _prompt_user(message=message, level=LogLevel.WARNING)
 
-    # Moves all motors to the animal mounting position.
-    zaber_motors.mount_position()
+    # Homes all managed motors in parallel and moves them to the animal mounting position. The motors are kept unparked
+    # between the two motion sequences.
+    with zaber_motors.unparked():
+        zaber_motors.prepare_motors()
+        zaber_motors.mount_position()
 
     message = "Motor Positioning: Complete."
     console.echo(message=message, level=LogLevel.SUCCESS)
@@ -235,9 +266,7 @@ def _setup_zaber_motors(zaber_motors: ZaberMotors) -> None:
         "Preparing to move the motors into the imaging position. Mount the animal onto the VR rig. Do NOT "
         "adjust any motors manually at this time. Do NOT install the mesoscope objective."
     )
-    console.echo(message=message, level=LogLevel.WARNING)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message, level=LogLevel.WARNING)
 
     # Restores all motors to the positions used during the previous session's runtime.
     zaber_motors.restore_position()
@@ -264,20 +293,13 @@ def _reset_zaber_motors(zaber_motors: ZaberMotors) -> None:
     console.echo(message=message, level=LogLevel.INFO)
     _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
 
-    while True:
-        user_input = input("Enter 'yes' or 'no': ").strip().lower()
-        answer = user_input[0] if user_input else ""
-
-        # Continues with the rest of the shutdown runtime
-        if answer == "y":
-            break
-
-        # Ends the runtime, as there is no need to move Zaber motors.
-        if answer == "n":
-            # Disconnects from Zaber motors. This does not change motor positions but does lock (park) all motors
-            # before disconnecting.
-            zaber_motors.disconnect()
-            return
+    # If the user declines, ends the runtime, as there is no need to move Zaber motors. Otherwise, continues with the
+    # rest of the shutdown runtime.
+    if not _prompt_yes_no():
+        # Disconnects from Zaber motors. This does not change motor positions but does lock (park) all motors before
+        # disconnecting.
+        zaber_motors.disconnect()
+        return
 
     # Helps with removing the animal from the enclosure by retracting the lick-port in the Y-axis (moving it away
     # from the animal).
@@ -289,9 +311,7 @@ def _reset_zaber_motors(zaber_motors: ZaberMotors) -> None:
     console.echo(message=message, level=LogLevel.SUCCESS)
 
     message = "Uninstall the mesoscope objective and REMOVE the animal from the Mesoscope's enclosure."
-    console.echo(message=message, level=LogLevel.WARNING)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message, level=LogLevel.WARNING)
 
     # Moves all motors to the hardcoded parking positions.
     zaber_motors.park_position()
@@ -317,8 +337,11 @@ def _setup_mesoscope(session_data: SessionData, mesoscope_data: MesoscopeData) -
     # Step 0: Clears out the mesoscope_data directory.
     # Ensures that the mesoscope_data directory is reset before running the mesoscope's preparation sequence. To
     # minimize the risk of important data loss, this procedure now requires the user to remove the files manually.
+    # Note: the ScanImagePC directories are accessed over the network, so all directory checks below only list the
+    # names of the stored files, avoiding building Path objects and querying the attributes of each file.
     while True:
-        existing_files = list(mesoscope_data.scanimagepc_data.mesoscope_data_path.glob("*"))
+        with os.scandir(mesoscope_data.scanimagepc_data.mesoscope_data_path) as entries:
+            existing_files = [entry.name for entry in entries]
 
         if not existing_files:
             break
@@ -326,12 +349,9 @@ def _setup_mesoscope(session_data: SessionData, mesoscope_data: MesoscopeData) -
         message = (
             f"Unable to prepare the Mesoscope for the data acquisition runtime. The preparation requires the shared "
             f"'mesoscope_data' ScanImagePC directory to be empty, but the directory contains the following unexpected "
-            f"files: {','.join([file.name for file in existing_files])}. Clear the directory from all existing files "
-            f"before proceeding."
+            f"files: {','.join(existing_files)}. Clear the directory from all existing files before proceeding."
         )
-        console.echo(message=message, level=LogLevel.ERROR)
-        _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-        input("Enter anything to continue: ")
+        _prompt_user(message=message, level=LogLevel.ERROR)
 
     # Step 1: Resolves the imaging plane.
     # If the previous session's mesoscope positions were saved, loads the imaging coordinates and displays them to the
@@ -360,22 +380,19 @@ def _setup_mesoscope(session_data: SessionData, mesoscope_data: MesoscopeData) -
             "Follow the steps of the window checking protocol available from the sl-protocols repository to establish "
             "the imaging plane for the animal."
         )
-    console.echo(message=message, level=LogLevel.INFO)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message)
 
     # Step 2: Generates the screenshot of the red-dot alignment and the cranial window.
     message = (
         "Generate the screenshot of the red-dot alignment, the imaging plane state (cell activity), and the "
         "ScanImage acquisition parameters by pressing the 'Win + PrtSc' combination."
     )
-    console.echo(message=message, level=LogLevel.INFO)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message)
 
     # Ensures that the screenshot is created before proceeding further.
     while True:
-        screenshots = list(mesoscope_data.scanimagepc_data.meso_data_path.glob("*.png"))
+        with os.scandir(mesoscope_data.scanimagepc_data.meso_data_path) as entries:
+            screenshots = [Path(entry.path) for entry in entries if entry.name.endswith(".png")]
 
         if screenshots:
             break
@@ -385,9 +402,7 @@ def _setup_mesoscope(session_data: SessionData, mesoscope_data: MesoscopeData) -
             f"'mesodata' ScanImagePC directory, but instead found {len(screenshots)} candidate files. Ensure that the "
             f"directory only stores the .png screenshot generated during the previous preparation step."
         )
-        console.echo(message=message, level=LogLevel.ERROR)
-        _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-        input("Enter anything to continue: ")
+        _prompt_user(message=message, level=LogLevel.ERROR)
 
     # Transfers the screenshot to the session's mesoscope_frames directory
     screenshot_path = session_data.raw_data.window_screenshot_path
@@ -405,19 +420,11 @@ def _setup_mesoscope(session_data: SessionData, mesoscope_data: MesoscopeData) -
         console.echo(message=message, level=LogLevel.INFO)
         _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
 
-        # Blocks until a valid answer is received from the user
-        while True:
-            user_input = input("Enter 'yes' or 'no': ").strip().lower()
-            answer = user_input[0] if user_input else ""
-
-            if answer == "n":
-                # Aborts the runtime if the user does not intend to generate the ROI and MotionEstimator data
-                console.echo(message="Mesoscope preparation: Complete.", level=LogLevel.SUCCESS)
-                return
-
-            if answer == "y":
-                # Proceeds with the metadata file acquisition sequence
-                break
+        # Aborts the runtime if the user does not intend to generate the ROI and MotionEstimator data. Otherwise,
+        # proceeds with the metadata file acquisition sequence.
+        if not _prompt_yes_no():
+            console.echo(message="Mesoscope preparation: Complete.", level=LogLevel.SUCCESS)
+            return
 
         # Ensures that kinase is removed, while the phosphatase is present. This aborts the runtime
         # after generating the zstack.tiff and the MotionEstimator.me files.
@@ -435,34 +442,30 @@ def _setup_mesoscope(session_data: SessionData, mesoscope_data: MesoscopeData) -
         "Call the 'setupAcquisition(hSI, hSICtl)' function via MATLAB's command line interface on the ScanImagePC to "
         "prepare and arm the mesoscope to acquire the session's data."
     )
-    console.echo(message=message, level=LogLevel.INFO)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message)
 
     # The preparation function generates 3 files: MotionEstimator.me, fov.roi, and zstack.tiff.
-    target_files = (
-        mesoscope_data.scanimagepc_data.mesoscope_data_path.joinpath("MotionEstimator.me"),
-        mesoscope_data.scanimagepc_data.mesoscope_data_path.joinpath("fov.roi"),
-        mesoscope_data.scanimagepc_data.mesoscope_data_path.joinpath("zstack.tiff"),
-    )
+    target_files = ("MotionEstimator.me", "fov.roi", "zstack.tiff")
 
-    # Waits until the necessary files are generated on the ScanImagePC.
+    # Waits until the necessary files are generated on the ScanImagePC. Each check lists the directory once instead of
+    # querying the existence of each target file separately. Since the ScanImagePC share resolves file names
+    # case-insensitively, the listed names are compared in lowercase to match the behavior of per-file existence checks.
     while True:
-        missing_files = [f for f in target_files if not f.exists()]
+        with os.scandir(mesoscope_data.scanimagepc_data.mesoscope_data_path) as entries:
+            generated_files = {entry.name.lower() for entry in entries}
+        missing_files = [file for file in target_files if file.lower() not in generated_files]
 
         if not missing_files:
             break
 
-        missing_names = ", ".join(f.name for f in missing_files)
+        missing_names = ", ".join(missing_files)
 
         message = (
             f"Unable to confirm that the ScanImagePC has generated the required acquisition data files, as the "
             f"following expected files are missing from the 'mesoscope_data' directory: {missing_names}. Rerun the "
             f"setupAcquisition(hSI, hSICtl) function to generate the requested files."
         )
-        console.echo(message=message, level=LogLevel.ERROR)
-        _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-        input("Enter anything to continue: ")
+        _prompt_user(message=message, level=LogLevel.ERROR)
 
     console.echo(message="Mesoscope preparation: Complete.", level=LogLevel.SUCCESS)
 
@@ -483,29 +486,31 @@ def _verify_descriptor_update(
         session_data: The SessionData instance that defines the session for which the descriptor file is generated.
         mesoscope_data: The MesoscopeData instance that defines the current Mesoscope-VR system's configuration.
     """
+    # Resolves the paths and the session name used throughout the descriptor verification sequence once.
+    session_name = session_data.session_name
+    descriptor_path = session_data.raw_data.session_descriptor_path
+
     # Saves the descriptor as a .yaml file.
-    descriptor.to_yaml(file_path=session_data.raw_data.session_descriptor_path)
+    descriptor.to_yaml(file_path=descriptor_path)
     console.echo(message="Session descriptor precursor file: Created.", level=LogLevel.SUCCESS)
 
     # Instructs the user to add user-collected data to the cached descriptor file.
     message = (
-        f"Update the data inside the session_descriptor.yaml file stored under the {session_data.session_name} "
+        f"Update the data inside the session_descriptor.yaml file stored under the {session_name} "
         f"session's 'raw_data' directory to include the notes and data collected by the user supervising the runtime "
         f"during the session's data acquisition."
     )
 
-    console.echo(message=message, level=LogLevel.INFO)
-    _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-    input("Enter anything to continue: ")
+    _prompt_user(message=message)
 
     # Defines error messages for file operations
     io_error_message = (
-        f"Unable to read the data from the {session_data.session_name} session's session_descriptor.yaml file. This "
+        f"Unable to read the data from the {session_name} session's session_descriptor.yaml file. This "
         f"indicates that the file was mis-formatted during editing. Make sure the file contents follow the .YAML "
         f"format before retrying."
     )
     validation_error_message = (
-        f"Failed to verify that the session_descriptor.yaml file stored inside the {session_data.session_name} "
+        f"Failed to verify that the session_descriptor.yaml file stored inside the {session_name} "
         f"session's raw_data directory has been updated to include the supervising user's notes taken during "
         f"runtime. Manually edit the session_descriptor.yaml file and replace the default text under the "
         f"'experimenter_notes' field with the notes taken during runtime. Make sure to save the changes by pressing "
@@ -517,7 +522,7 @@ def _verify_descriptor_update(
         # Attempts to read the session's descriptor data from the .yaml file.
         # noinspection PyBroadException
         try:
-            descriptor = descriptor.from_yaml(file_path=session_data.raw_data.session_descriptor_path)
+            descriptor = descriptor.from_yaml(file_path=descriptor_path)
         except Exception:
             console.echo(message=io_error_message, level=LogLevel.ERROR)
             input("Enter anything to continue: ")
@@ -535,10 +540,7 @@ def _verify_descriptor_update(
     # If the descriptor has passed the verification, copies it up to the animal's persistent directory. This is a
     # feature primarily used during training to restore the training parameters between training sessions of the
     # same type.
-    sh.copy2(
-        src=session_data.raw_data.session_descriptor_path,
-        dst=mesoscope_data.vrpc_data.session_descriptor_path,
-    )
+    sh.copy2(src=descriptor_path, dst=mesoscope_data.vrpc_data.session_descriptor_path)
 
 
 class _MesoscopeVRStates(IntEnum):
@@ -897,21 +899,23 @@ class _MesoscopeVRSystem:
         # If a previous set of mesoscope position coordinates is available, overwrites the 'default' mesoscope
         # coordinates with the positions loaded from the snapshot stored inside the persistent_data directory of the
         # animal.
-        if self._mesoscope_data.vrpc_data.mesoscope_positions_path.exists():
+        session_positions_path = session_data.raw_data.mesoscope_positions_path
+        persistent_positions_path = self._mesoscope_data.vrpc_data.mesoscope_positions_path
+        if persistent_positions_path.exists():
             # Loading and re-dumping the data updates the contents of the position's file to dynamically integrate any
             # upstream changes in the sl-shared-assets into the file structure.
             previous_mesoscope_positions: MesoscopePositions = MesoscopePositions.from_yaml(
-                file_path=self._mesoscope_data.vrpc_data.mesoscope_positions_path
+                file_path=persistent_positions_path
             )
-            previous_mesoscope_positions.to_yaml(file_path=session_data.raw_data.mesoscope_positions_path)
+            previous_mesoscope_positions.to_yaml(file_path=session_positions_path)
 
         # If previous position data is not available, creates a new MesoscopePositions instance with default position
         # values.
         else:
             # Caches the precursor file to the raw_data session directory and to the persistent data directory.
             precursor = MesoscopePositions()
-            precursor.to_yaml(file_path=session_data.raw_data.mesoscope_positions_path)
-            precursor.to_yaml(file_path=self._mesoscope_data.vrpc_data.mesoscope_positions_path)
+            precursor.to_yaml(file_path=session_positions_path)
+            sh.copy2(src=session_positions_path, dst=persistent_positions_path)
 
         # Defines the asset used to set and maintain combinations of system and runtime (task) states.
         self._system_state: int = 0
@@ -955,6 +959,16 @@ class _MesoscopeVRSystem:
             camera_configuration=self._system_configuration.cameras,
         )
 
+        # If the system has a snapshot of the Zaber positions used during a previous runtime, loads it into memory and
+        # restores all Zaber motors to that snapshot. Otherwise, uses predefined default positions and expects the
+        # user to fine-tune them as necessary. The snapshot is loaded before prompting the user, as it does not
+        # depend on the state of the Zaber motor ports.
+        zaber_positions_path = self._mesoscope_data.vrpc_data.zaber_positions_path
+        if zaber_positions_path.exists():
+            zaber_positions = ZaberPositions.from_yaml(file_path=zaber_positions_path)
+        else:
+            zaber_positions = None
+
         # The ZaberLauncher UI cannot connect to the ports managed by Python bindings, so it must be initialized before
         # connecting to motor groups from Python.
         message = (
@@ -962,17 +976,7 @@ class _MesoscopeVRSystem:
             "proceeding further. If the ZaberLauncher is not running, it will be IMPOSSIBLE to manually control the "
             "Zaber motors."
         )
-        console.echo(message=message, level=LogLevel.WARNING)
-        _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-        input("Enter anything to continue: ")
-
-        # If the system has a snapshot of the Zaber positions used during a previous runtime, loads it into memory and
-        # restores all Zaber motors to that snapshot. Otherwise, uses predefined default positions and expects the
-        # user to fine-tune them as necessary.
-        if self._mesoscope_data.vrpc_data.zaber_positions_path.exists():
-            zaber_positions = ZaberPositions.from_yaml(file_path=self._mesoscope_data.vrpc_data.zaber_positions_path)
-        else:
-            zaber_positions = None
+        _prompt_user(message=message, level=LogLevel.WARNING)
 
         # Initializes the binding class for all Zaber motors.
         self._zaber_motors: ZaberMotors = ZaberMotors(
@@ -997,7 +1001,12 @@ class _MesoscopeVRSystem:
         self._motif_decomposer = CachedMotifDecomposer()
 
         # Initializes but does not start the assets used by all runtimes. These assets need to be started in a
-        # specific order, which is handled by the start() method.
+        # specific order, which is handled by the start() method. The Qt and matplotlib-backed assets are imported
+        # here, rather than at the module level, so that CLI commands that do not run the Mesoscope-VR system do not
+        # pay the cost of importing the GUI libraries.
+        from .runtime_ui import RuntimeControlUI  # noqa: PLC0415
+        from .visualizers import BehaviorVisualizer  # noqa: PLC0415
+
         # noinspection PyProtectedMember
         self._ui: RuntimeControlUI = RuntimeControlUI(
             valve_tracker=self._microcontrollers.valve._valve_tracker,  # noqa: SLF001
@@ -1055,8 +1064,7 @@ class _MesoscopeVRSystem:
             self._setup_unity()
 
         # Begins acquiring and displaying frames with the all available cameras.
-        self._cameras.start_face_camera()
-        self._cameras.start_body_camera()
+        self._cameras.start_all()
 
         # If necessary, carries out the Zaber motor setup and animal mounting sequence and generates a snapshot of all
         # zaber motor positions. This serves as an early checkpoint in case the runtime has to be aborted in a
@@ -1075,6 +1083,8 @@ class _MesoscopeVRSystem:
 
         # Determines the visualizer mode based on session type. This mode is used by both the runtime control UI and
         # the behavior visualizer to conditionally enable/disable UI elements.
+        from .visualizers import VisualizerMode  # noqa: PLC0415
+
         if self._session_data.session_type == SessionTypes.LICK_TRAINING:
             visualizer_mode = VisualizerMode.LICK_TRAINING
         elif self._session_data.session_type == SessionTypes.RUN_TRAINING:
@@ -1375,7 +1385,7 @@ class _MesoscopeVRSystem:
             payload = self._wait_for_unity_topic(expected_topic=_MesoscopeVRMQTTTopics.UNITY_SCENE)
 
             # Extracts the name of the scene running in Unity.
-            scene_name: str = json.loads(payload.decode("utf-8"))["name"]
+            scene_name: str = json.loads(payload)["name"]
             expected_scene_name: str = self._experiment_configuration.unity_scene_name  # type: ignore[union-attr]
 
             if scene_name == expected_scene_name:
@@ -1406,6 +1416,9 @@ class _MesoscopeVRSystem:
         )
         console.echo(message=message, level=LogLevel.INFO)
 
+        # Pre-generates the payload that advances the Unity scene forward by 0.1 Unity unit (~ 10 mm).
+        byte_array = _MOVEMENT_PAYLOAD_TEMPLATE % 0.1
+
         # Continuously loops the display verification process until the user confirms success.
         while True:
             # Sends continuous position updates to Unity to animate the VR environment for visual verification.
@@ -1414,8 +1427,6 @@ class _MesoscopeVRSystem:
                 _response_delay_timer.delay(delay=100, block=False)
 
                 # Advances the Unity scene forward by 0.1 Unity unit (~ 10 mm).
-                json_string = dumps(obj={"movement": 0.1})
-                byte_array = json_string.encode("utf-8")
                 self._unity.send_data(topic=_MesoscopeVRMQTTTopics.ENCODER_DATA, payload=byte_array)
 
                 # Parses incoming data from Unity to detect termination.
@@ -1433,14 +1444,8 @@ class _MesoscopeVRSystem:
             message = "Did the Virtual Reality display render correctly on the VR screens?"
             console.echo(message=message, level=LogLevel.INFO)
 
-            # Requests the user to provide a valid answer.
-            answer = ""
-            while answer not in {"y", "n"}:
-                user_input = input("Enter 'yes' or 'no': ").strip().lower()
-                answer = user_input[0] if user_input else ""
-
             # Breaks the verification loop if the user confirms the displays are working correctly.
-            if answer == "y":
+            if _prompt_yes_no():
                 break
 
             # Otherwise, notifies the user that the verification will restart.
@@ -1536,9 +1541,7 @@ class _MesoscopeVRSystem:
                     continue
 
                 # Successfully received the cue sequence - extracts and processes it.
-                self._unity_state.cue_sequence = np.array(
-                    json.loads(data[1].decode("utf-8"))["cue_sequence"], dtype=np.uint8
-                )
+                self._unity_state.cue_sequence = np.array(json.loads(data[1])["cue_sequence"], dtype=np.uint8)
 
                 # Logs the received sequence.
                 self._logger.input_queue.put(
@@ -1626,12 +1629,13 @@ class _MesoscopeVRSystem:
             )
             console.error(message=message, error=RuntimeError)
 
-        # Constructs the cumulative distance array directly from decomposed trial indices.
-        self._trial_state.distances = np.cumsum(distances_array[trial_indices_array[:trial_count]].astype(np.float64))
+        # Constructs the cumulative distance array directly from decomposed trial indices. Accumulating in float64
+        # via the dtype argument avoids allocating an intermediate upcast copy of the gathered distances.
+        sequence_indices = trial_indices_array[:trial_count]
+        self._trial_state.distances = np.cumsum(distances_array[sequence_indices], dtype=np.float64)
 
         # Builds per-trial reward and puff duration arrays from the decomposed sequence. Each entry corresponds to
         # a trial in the actual sequence, not a trial type.
-        sequence_indices = trial_indices_array[:trial_count]
         self._trial_state.reinforcing_rewards = tuple(reinforcing_rewards_by_type[i] for i in sequence_indices)
         self._trial_state.aversive_puff_durations = tuple(aversive_puff_durations_by_type[i] for i in sequence_indices)
 
@@ -1728,13 +1732,13 @@ class _MesoscopeVRSystem:
 
             # Clears any unexpected TIFF files the first time the method is called for a session. This ensures that the
             # number of mesoscope frame acquisition pulses always matches the number of frames recorded for the
-            # session.
+            # session. Scans the directory once, matching both TIFF extensions in the same pass.
             if not self._mesoscope_started:
-                for pattern in ["*.tif", "*.tiff"]:
-                    for file in self._mesoscope_data.scanimagepc_data.mesoscope_data_path.glob(pattern):
+                with os.scandir(self._mesoscope_data.scanimagepc_data.mesoscope_data_path) as entries:
+                    for entry in entries:
                         # Excludes zstack files generated during the imaging field setup from cleanup.
-                        if "zstack" not in file.name:
-                            file.unlink(missing_ok=True)
+                        if entry.name.endswith((".tif", ".tiff")) and "zstack" not in entry.name:
+                            Path(entry.path).unlink(missing_ok=True)
 
             # Sends the acquisition trigger by creating the kinase marker file.
             self._mesoscope_data.scanimagepc_data.kinase_path.touch()
@@ -2222,8 +2226,8 @@ class _MesoscopeVRSystem:
 
             if position_delta != 0:
                 self._unity_state.position = current_position
-                json_string = dumps(obj={"movement": position_delta})
-                byte_array = json_string.encode("utf-8")
+                # Converts the delta to a Python float, as NumPy scalars use a different string representation.
+                byte_array = _MOVEMENT_PAYLOAD_TEMPLATE % float(position_delta)
                 self._unity.send_data(topic=_MesoscopeVRMQTTTopics.ENCODER_DATA, payload=byte_array)
 
             # Checks if the animal has completed the current trial.
@@ -2322,7 +2326,7 @@ class _MesoscopeVRSystem:
 
         # Handles occupancy guidance delay messages for brake pulsing.
         if data[0] == _MesoscopeVRMQTTTopics.TRIGGER_DELAY:
-            payload = json.loads(data[1].decode("utf-8"))
+            payload = json.loads(data[1])
             delay_ms = payload.get("delay_ms", 0)
             if delay_ms > 0:
                 self._microcontrollers.brake.send_pulse(duration_ms=delay_ms)
@@ -2509,19 +2513,11 @@ class _MesoscopeVRSystem:
         # Verifies that the user intends to abort the runtime to avoid 'misclick' terminations.
         message = "Runtime abort signal: Received. Are you sure you want to abort the runtime?"
         console.echo(message=message, level=LogLevel.WARNING)
-        while True:
-            user_input = input("Enter 'yes' or 'no': ").strip().lower()
-            answer = user_input[0] if user_input else ""
 
-            # Sets the runtime into the termination state, which aborts all instance cycles and the outer logic function
-            # cycle.
-            if answer == "y":
-                self._terminated = True
-                return
-
-            # Returns without terminating the runtime
-            if answer == "n":
-                return
+        # If the user confirms the abort, sets the runtime into the termination state, which aborts all instance cycles
+        # and the outer logic function cycle. Otherwise, returns without terminating the runtime.
+        if _prompt_yes_no():
+            self._terminated = True
 
     def setup_reinforcing_guidance(
         self, initial_guided_trials: int = 3, recovery_mode_threshold: int = 9, recovery_guided_trials: int = 3
@@ -2670,7 +2666,7 @@ def window_checking_logic(
     # Generates and caches the MesoscopePositions precursor file to the persistent and raw_data directories.
     precursor = MesoscopePositions()
     precursor.to_yaml(file_path=session_data.raw_data.mesoscope_positions_path)
-    precursor.to_yaml(file_path=mesoscope_data.vrpc_data.mesoscope_positions_path)
+    sh.copy2(src=session_data.raw_data.mesoscope_positions_path, dst=mesoscope_data.vrpc_data.mesoscope_positions_path)
 
     zaber_motors: ZaberMotors | None = None
     try:
@@ -2710,9 +2706,7 @@ def window_checking_logic(
             "proceeding further. If the ZaberLauncher is not running, it will be IMPOSSIBLE to manually control the "
             "Zaber motors."
         )
-        console.echo(message=message, level=LogLevel.WARNING)
-        _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
-        input("Enter anything to continue: ")
+        _prompt_user(message=message, level=LogLevel.WARNING)
 
         # Establishes communication with Zaber motors
         zaber_motors = ZaberMotors(zaber_positions=zaber_positions, zaber_configuration=system_configuration.assets)
@@ -3786,10 +3780,7 @@ def maintenance_logic() -> None:
         message="Do you want to position the managed Zaber motors for valve calibration or referencing procedure?",
         level=LogLevel.INFO,
     )
-    move_zaber_motors = ""
-    while move_zaber_motors not in ["y", "n"]:
-        user_input = input("Enter 'yes' or 'no': ").strip().lower()
-        move_zaber_motors = user_input[0] if user_input else ""
+    move_zaber_motors = _prompt_yes_no()
 
     # All calibration procedures are executed in a temporary directory deleted after runtime
     with tempfile.TemporaryDirectory(prefix="sl_maintenance_") as output_dir:
@@ -3832,7 +3823,7 @@ def maintenance_logic() -> None:
             _response_delay_timer.delay(delay=_RENDERING_SEPARATION_DELAY, block=False)
 
             # If Zaber motors are being used, initializes and moves them to the maintenance positions.
-            if move_zaber_motors == "y":
+            if move_zaber_motors:
                 message = "Initializing Zaber motors..."
                 console.echo(message=message, level=LogLevel.INFO)
                 zaber_motors: ZaberMotors = ZaberMotors(
@@ -3849,13 +3840,16 @@ def maintenance_logic() -> None:
                 _response_delay_timer.delay(delay=_RESPONSE_DELAY, block=False)
 
                 input("Press Enter to continue: ")
-                zaber_motors.prepare_motors()
-                zaber_motors.maintenance_position()
+                with zaber_motors.unparked():
+                    zaber_motors.prepare_motors()
+                    zaber_motors.maintenance_position()
 
                 message = "Zaber motors: Positioned for Mesoscope-VR system maintenance."
                 console.echo(message=message, level=LogLevel.SUCCESS)
 
             # Initializes the maintenance GUI
+            from .maintenance_ui import MaintenanceControlUI  # noqa: PLC0415
+
             # noinspection PyProtectedMember
             ui = MaintenanceControlUI(
                 valve_tracker=valve._valve_tracker,  # noqa: SLF001
@@ -3920,7 +3914,7 @@ def maintenance_logic() -> None:
             console.echo(message=message, level=LogLevel.INFO)
 
             # If Zaber motors were used and are still connected, moves them to the park position.
-            if move_zaber_motors == "y" and zaber_motors.is_connected:
+            if move_zaber_motors and zaber_motors.is_connected:
                 message = (
                     "Preparing to reset all Zaber motors. Remove all objects used during Mesoscope-VR maintenance, "
                     "such as water collection flasks, from the Mesoscope-VR cage."
@@ -10,6 +10,7 @@ from sl_shared_assets import (
     GasPuffTrial,
     ExperimentState as ExperimentState,
     WaterRewardTrial,
+    MesoscopePositions,
     RunTrainingDescriptor,
     LickTrainingDescriptor,
     WindowCheckingDescriptor,
@@ -17,6 +18,7 @@ from sl_shared_assets import (
     MesoscopeExperimentDescriptor,
     MesoscopeExperimentConfiguration,
 )
+from ataraxis_base_utilities import LogLevel
 from ataraxis_data_structures import DataLogger
 from ataraxis_communication_interface import MQTTCommunication
 
@@ -53,7 +55,11 @@ from .data_preprocessing import (
 _RESPONSE_DELAY: int
 _RENDERING_SEPARATION_DELAY: int
 _response_delay_timer: Incomplete
+_MOVEMENT_PAYLOAD_TEMPLATE: bytes
 
+def _get_mesoscope_coordinates(positions: MesoscopePositions) -> tuple[float, ...]: ...
+def _prompt_user(message: str, level: LogLevel = ...) -> None: ...
+def _prompt_yes_no() -> bool: ...
 def _generate_mesoscope_position_snapshot(session_data: SessionData, mesoscope_data: MesoscopeData) -> None: ...
 def _generate_zaber_snapshot(
     session_data: SessionData, mesoscope_data: MesoscopeData, zaber_motors: ZaberMotors
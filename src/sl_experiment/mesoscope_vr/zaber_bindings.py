@@ -1,6 +1,7 @@
 """Provides the interfaces for Zaber devices used in the Mesoscope-VR data acquisition system."""
 
 from typing import Any
+from pathlib import Path
 from dataclasses import field, dataclass
 from collections.abc import Callable  # noqa: TC003
 
@@ -154,6 +155,30 @@ def _scan_active_ports() -> list[_ZaberPortData]:
     return port_info_list
 
 
+def _enable_low_latency(port: str) -> None:
+    """Reduces the latency timer of the FTDI USB-serial adapter used by the specified port to 1 millisecond.
+
+    Notes:
+        By default, FTDI adapters buffer the received data for up to 16 milliseconds before passing it to the host,
+        which delays every reply sent by Zaber devices. This function only works for FTDI adapters on Linux hosts and
+        silently returns if the latency timer of the target port is not exposed or cannot be modified by the user.
+
+    Args:
+        port: The name of the USB port for which to reduce the latency timer.
+    """
+    # Resolves symbolic links, such as /dev/serial/by-id/ paths, to the underlying tty device name used by sysfs.
+    latency_timer = Path("/sys/bus/usb-serial/devices").joinpath(Path(port).resolve().name, "latency_timer")
+    if not latency_timer.exists():
+        return
+
+    # Modifying the latency timer typically requires root privileges or a matching udev rule. If the timer cannot be
+    # modified, the connection uses the default latency timer.
+    try:
+        latency_timer.write_text("1")
+    except OSError as e:
+        console.echo(message=f"Unable to reduce the latency timer of port {port}: {e}.", level=LogLevel.DEBUG)
+
+
 def _format_device_info(port_info_list: list[_ZaberPortData]) -> str:
     """Formats the device and axis ID information discovered during port scanning as a table before displaying it to
      the user.
@@ -980,7 +1005,9 @@ class ZaberConnection:
         if self.is_connected:
             return
 
-        # Establishes connection
+        # Establishes connection. Before opening the port, minimizes the delay with which the USB-serial adapter
+        # forwards the device replies to the host, which speeds up all motor state and position queries.
+        _enable_low_latency(port=self._port)
         self._connection = Connection.open_serial_port(port_name=self._port, direct=False)
         self._is_connected = True
 
@@ -1039,8 +1066,10 @@ class ZaberConnection:
         Raises:
             ConnectionError : If the instance is not connected to the managed serial port.
         """
-        # Prevents retrieving the device data if the connection has not been established.
-        if not self.is_connected:
+        # Prevents retrieving the device data if the connection has not been established. Since the device interfaces
+        # are cached when the connection is established, this check uses the cached connection state instead of probing
+        # the serial port.
+        if not self._is_connected:
             message = (
                 f"Unable to retrieve the Zaber device at index {index} as the ZaberConnection instance has not "
                 f"established the connection with the managed port ({self._port})."
@@ -54,6 +54,7 @@ class ZaberValidationResult:
 
 def _attempt_connection(port: str) -> list[_ZaberDeviceData]: ...
 def _scan_active_ports() -> list[_ZaberPortData]: ...
+def _enable_low_latency(port: str) -> None: ...
 def _format_device_info(port_info_list: list[_ZaberPortData]) -> str: ...
 def discover_zaber_devices() -> None: ...
 def get_zaber_devices_info() -> str: ...
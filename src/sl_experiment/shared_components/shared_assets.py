@@ -1,15 +1,21 @@
 """Provides miscellaneous assets shared by other library packages."""
 
 import sys
+from functools import cache
 
 from natsort_rs import natsort as natsorted  # type: ignore[import-untyped]
 from sl_shared_assets import MesoscopeFileSystem, get_system_configuration_data
 from importlib_metadata import metadata as _metadata
 
 
+@cache
 def get_version_data() -> tuple[str, str]:
     """Returns the current Python and sl-experiment versions.
 
+    Notes:
+        Since the versions cannot change while the library is running, the versions are resolved once and reused by
+        all further calls to this function.
+
     Returns:
         A tuple of two strings. The first string stores the Python version, and the second string stores the
         sl-experiment version.